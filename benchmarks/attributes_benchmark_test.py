@@ -0,0 +1,37 @@
+"""
+Contains benchmarks for the attributes module.
+
+These live outside of the test paths so that they are not run with the rest
+of the tests. Run them explicitly with `pytest benchmarks/`.
+"""
+
+from typing import Any
+
+from balisage.attributes import Attributes, Classes
+
+# Expected rendered string for the sample attributes
+EXPECTED_CONSTRUCT = (
+    "class='class-1 class2' id='test' width='50' disabled checked"
+)
+
+# MARK: Benchmarks
+
+
+def test_bench_sanitize_name(benchmark: Any, classes: Classes) -> None:
+    """Benchmarks the _sanitize_name method of the Classes class."""
+    result = benchmark.pedantic(
+        classes._sanitize_name,
+        args=("  Class 4   ",),
+        rounds=1000,
+        iterations=100,
+        warmup_rounds=10,
+    )
+    assert result == "class-4"
+
+
+def test_bench_attributes_construct(
+    benchmark: Any, attributes: Attributes
+) -> None:
+    """Benchmarks the construct method of the Attributes class."""
+    result = benchmark(attributes.construct)
+    assert result == EXPECTED_CONSTRUCT
@@ -0,0 +1,28 @@
+"""
+Contains shared fixtures for the benchmarks.
+"""
+
+import pytest
+
+from balisage.attributes import Attributes, Classes
+
+
+@pytest.fixture
+def classes() -> Classes:
+    """Creates a sample Classes object."""
+    return Classes("class 1", "clAss2")
+
+
+@pytest.fixture
+def attributes() -> Attributes:
+    """Creates a sample Attributes object."""
+    return Attributes(
+        {
+            "class": Classes("class 1", "class2"),
+            "id": "test",
+            "width": 50,
+            "disabled": None,
+            "checked": True,
+            "itemscope": False,
+        }
+    )
@@ -4,15 +4,19 @@ Contains code related to HTML attributes.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator, Self, Type
+from copy import deepcopy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, Self, Type
 
 from .utilities.validate import (
     get_type_name_string,
     is_element,
     is_valid_type,
+    parse_attribute_string,
     raise_for_type,
     sanitize_class_name,
-    split_preserving_quotes,
+    sanitize_class_names,
     types_to_tuple,
 )
 
@@ -20,16 +24,77 @@ if TYPE_CHECKING:
     from .types import AttributeMap, AttributeValue, ClassesType, Element
 
 
+@lru_cache(maxsize=128)
+def _parse_class_string(string: str) -> Classes:
+    """Parses a class string into a Classes object, caching the result.
+
+    The returned object is shared between calls, so it must be cloned rather
+    than used directly.
+    """
+    return Classes(*string.split())
+
+
+@lru_cache(maxsize=256)
+def _parse_attribute_items(string: str) -> tuple[tuple[str, str | bool], ...]:
+    """Parses an attribute string into attribute items, caching the result.
+
+    The items are returned as an immutable tuple so that the cached result can
+    be shared between calls.
+    """
+    return tuple(parse_attribute_string(string).items())
+
+
+def _get_slot_state(obj: Any) -> dict[str, Any]:
+    """Gets the state of an object whose class defines __slots__.
+
+    The state holds the value of every slot in the class hierarchy that has
+    been set, along with the instance dictionary of subclasses that have one.
+    """
+    state = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                state[name] = getattr(obj, name)
+    return state
+
+
+def _set_slot_state(obj: Any, state: dict[str, Any]) -> None:
+    """Restores the state of an object from _get_slot_state."""
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
+
+
+def _copy_subclass_state(
+    source: Any, clone: Any, base: type, memo: dict[int, Any]
+) -> None:
+    """Deep-copies any state that a subclass adds to one of the base classes.
+
+    The base class slots are expected to have been copied into the clone
+    already, so only the remaining state is copied.
+    """
+    if type(source) is base:
+        return
+    state = _get_slot_state(source)
+    for name in base.__slots__:
+        state.pop(name, None)
+    _set_slot_state(clone, deepcopy(state, memo))
+
+
 class Classes:
     """Class for managing classes for HTML elements."""
 
-    DEFAULT_REPLACEMENTS: dict[str, str] = {" ": "-"}
+    __slots__ = ("_canonical", "_html_cache", "_repr_cache", "_replacements")
+
+    DEFAULT_REPLACEMENTS: Mapping[str, str] = MappingProxyType({" ": "-"})
 
     def __init__(self, *names: str) -> None:
         """Initializes the Classes object."""
 
         # Initialize instance variables
-        self._classes = dict()
+        self._canonical: dict[str, str] = dict()
+        self._html_cache: str | None = None
+        self._repr_cache: str | None = None
         self.reset_replacements()
 
         # Set the classes
@@ -37,58 +102,70 @@ class Classes:
 
     @classmethod
     def from_string(cls, string: str) -> Self:
-        """Creates a Classes object from a string."""
-        return cls(*string.split(" "))
+        """Creates a Classes object from a string.
+
+        Parsed class strings are cached, so repeated strings only need to be
+        sanitized once.
+        """
+        # Subclasses may hold additional state, so they are always initialized
+        if cls is not Classes:
+            return cls(*string.split())
+        return _parse_class_string(string).clone()
 
     @property
-    def classes(self) -> dict[str:str]:
-        """Gets the stored classes as a dictionary.
+    def classes(self) -> Mapping[str, str]:
+        """Gets the stored classes as a read-only mapping.
 
         Keys are the original class names, values are the sanitized class names.
+
+        The mapping is a snapshot that is built on each access, so it can not
+        be modified; use the add, set, and remove methods instead.
         """
-        return self._classes
+        return MappingProxyType(
+            {
+                original: sanitized
+                for sanitized, original in self._canonical.items()
+            }
+        )
 
     @property
-    def replacements(self) -> dict[str, str]:
+    def replacements(self) -> Mapping[str, str]:
         """Gets the replacements dictionary.
 
         The replacements dictionary controls the replacement of specified
         characters in provided class names when they are sanitized.
 
         Keys are the characters to be replaced, values are the replacements.
+
+        Unless new replacements have been set, this is the read-only
+        DEFAULT_REPLACEMENTS mapping shared by all instances.
         """
+        if self._replacements is None:
+            return self.DEFAULT_REPLACEMENTS
         return self._replacements
 
     @replacements.setter
-    def replacements(self, replacements: dict[str, str]) -> None:
-        """Sets the replacements dictionary."""
-        self._replacements = replacements
-        self.set(*self._classes.keys())
+    def replacements(self, replacements: Mapping[str, str]) -> None:
+        """Sets the replacements dictionary.
+
+        The provided replacements are copied, so later changes to the original
+        dictionary will not affect the instance.
+        """
+        self._replacements = dict(replacements)
+        self.set(*self._canonical.values())
 
     def reset_replacements(self) -> None:
         """Resets the replacements dictionary to its default value."""
-        self._replacements = self.DEFAULT_REPLACEMENTS
+        self._replacements = None
 
     def add(self, *names: str) -> None:
         """Adds classes to the list of classes.
 
         Note that duplicate classes will be ignored.
         """
-
-        # Determine the existing sanitized names
-        old_sanitized_names = list(self._classes.values())
-        # Determine the new sanitized names
-        new_original_names = names
-        new_sanitized_names = [self._sanitize_name(name) for name in names]
-        new_names = zip(new_original_names, new_sanitized_names)
-        # Check that duplicate classes aren't being added
-        filtered_names = {
-            new_original_name: new_sanitized_name
-            for new_original_name, new_sanitized_name in new_names
-            if new_sanitized_name not in old_sanitized_names
-        }
-        # Update the classes
-        self._classes.update(filtered_names)
+        for name, sanitized_name in zip(names, self._sanitize_names(names)):
+            self._canonical.setdefault(sanitized_name, name)
+        self._invalidate_caches()
 
     def set(self, *names: str) -> None:
         """Sets the list of classes."""
@@ -97,7 +174,11 @@ class Classes:
             raise TypeError(
                 f"Arguments passed to {method_name} must be strings"
             )
-        self._classes = {arg: self._sanitize_name(arg) for arg in names}
+        canonical = dict()
+        for name, sanitized_name in zip(names, self._sanitize_names(names)):
+            canonical.setdefault(sanitized_name, name)
+        self._canonical = canonical
+        self._invalidate_caches()
 
     def remove(self, name: str) -> tuple[str, str]:
         """Removes a class from the list of classes.
@@ -106,59 +187,119 @@ class Classes:
         The tuple is in the form of (class name, sanitized class name).
         """
 
-        # Try removing the class by its original name
-        try:
-            return name, self._classes.pop(name)
-        except KeyError:
-            pass
         # Try removing the class by its sanitized name
-        for original_name, sanitized_name in self._classes.items():
-            if sanitized_name == self._sanitize_name(name):
-                return original_name, self._classes.pop(original_name)
+        if name in self._canonical:
+            self._invalidate_caches()
+            return self._canonical.pop(name), name
+        # Try removing the class by sanitizing the provided name, which raises
+        # a ValueError if the name is invalid
+        if self._canonical:
+            sanitized_name = self._sanitize_name(name)
+            if sanitized_name in self._canonical:
+                self._invalidate_caches()
+                return self._canonical.pop(sanitized_name), sanitized_name
         # If the class was not found, raise an exception
         raise KeyError(f"Class '{name}' not found")
 
     def clear(self) -> None:
         """Clears the list of classes."""
-        self._classes.clear()
+        self._canonical.clear()
+        self._invalidate_caches()
+
+    def clone(self) -> Self:
+        """Creates an independent copy of the Classes object.
+
+        Custom replacements are copied too, since the replacements getter
+        exposes them as a mutable dictionary. The read-only default
+        replacements are shared. Any additional state held by subclasses is
+        deep-copied.
+        """
+        return self.__deepcopy__({})
+
+    def _invalidate_caches(self) -> None:
+        """Clears the cached string versions of the object."""
+        self._html_cache = None
+        self._repr_cache = None
 
     def _sanitize_name(self, name: str) -> str:
         """Converts a class string into a valid class name."""
-        return sanitize_class_name(name, replacements=self._replacements)
+        return sanitize_class_name(name, replacements=self.replacements)
+
+    def _sanitize_names(self, names: tuple[str, ...]) -> list[str]:
+        """Converts multiple class strings into valid class names at once."""
+        return sanitize_class_names(names, replacements=self.replacements)
 
     def construct(self) -> str:
-        """Generates the class string."""
-        return " ".join(self._classes.values())
+        """Generates the class string.
+
+        The result is cached until the classes are next modified.
+        """
+        if self._html_cache is None:
+            self._html_cache = " ".join(self._canonical)
+        return self._html_cache
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        """Creates a deep copy of the object.
+
+        Only the containers are copied, since the class names and cached
+        strings they hold are immutable.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        clone._canonical = self._canonical.copy()
+        clone._html_cache = self._html_cache
+        clone._repr_cache = self._repr_cache
+        if self._replacements is None:
+            clone._replacements = None
+        else:
+            clone._replacements = self._replacements.copy()
+        _copy_subclass_state(self, clone, Classes, memo)
+        return clone
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Gets the state of the object for pickling."""
+        return _get_slot_state(self)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores the state of the object when unpickling."""
+        _set_slot_state(self, state)
 
     def __eq__(self, other: Any) -> bool:
         """Determines whether two Classes objects are equal.
 
-        Since keys are only kept for historical reasons, equality is determined
-        by comparing the values (e.g., sanitized class names) of the classes.
+        Since original names are only kept for historical reasons, equality is
+        determined by comparing the sanitized class names.
         """
         if isinstance(other, self.__class__):
-            return set(self._classes.values()) == set(other._classes.values())
+            return self._canonical.keys() == other._canonical.keys()
         elif isinstance(other, dict):
-            return set(self._classes.values()) == set(other.values())
+            return self._canonical.keys() == set(other.values())
         return False
 
     def __bool__(self) -> bool:
         """Determines whether the instance is empty."""
-        return len(self._classes) > 0
+        return len(self._canonical) > 0
 
     def __str__(self) -> str:
         """Gets the string version of the object."""
         return self.construct()
 
     def __repr__(self) -> str:
-        """Gets the string representation of the object."""
-        arg_string = ", ".join(repr(c) for c in self._classes.keys())
-        return f"{self.__class__.__name__}({arg_string})"
+        """Gets the string representation of the object.
+
+        The result is cached until the classes are next modified.
+        """
+        if self._repr_cache is None:
+            arg_string = ", ".join(map(repr, self._canonical.values()))
+            self._repr_cache = f"{self.__class__.__name__}({arg_string})"
+        return self._repr_cache
 
 
 class Attributes:
     """Class for managing attributes for HTML elements."""
 
+    __slots__ = ("_attributes",)
+
     def __init__(self, attributes: AttributeMap | None = None) -> None:
         """Initializes the Attributes object."""
 
@@ -171,16 +312,12 @@ class Attributes:
 
     @classmethod
     def from_string(cls, string: str) -> Self:
-        """Creates an Attributes object from a string."""
-        attributes = dict()
-        pairs = split_preserving_quotes(string)
-        for pair in pairs:
-            key, _, value = pair.partition("=")
-            value = value.strip("'")
-            if not value:
-                value = True
-            attributes[key] = value
-        return cls(attributes)
+        """Creates an Attributes object from a string.
+
+        Parsed attribute strings are cached, so repeated strings only need to
+        be tokenized once.
+        """
+        return cls(dict(_parse_attribute_items(string)))
 
     @property
     def attributes(self) -> AttributeMap:
@@ -257,15 +394,21 @@ class Attributes:
         self._attributes.clear()
         self._attributes["class"] = Classes()
 
+    def clone(self) -> Self:
+        """Creates an independent copy of the Attributes object.
+
+        Any additional state held by subclasses is deep-copied.
+        """
+        return self.__deepcopy__({})
+
     def construct(self) -> str:
         """Generates the attribute string."""
         pairs = []
         for key, value in self._attributes.items():
-            # None and True values are boolean attributes, False will be ignored
-            if (value is None) or (isinstance(value, bool) and value):
-                pairs.append(f"{key}")
-            elif isinstance(value, Classes) and not value:
-                continue
+            # None and True values are boolean attributes, while False and
+            # other falsy values (including empty Classes) will be ignored
+            if value is None or value is True:
+                pairs.append(key)
             elif value:
                 pairs.append(f"{key}='{value}'")
         return " ".join(pairs)
@@ -278,13 +421,41 @@ class Attributes:
         """Sets an attribute in the Attributes object."""
         self._attributes[key] = value
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        """Creates a deep copy of the object.
+
+        Classes values are cloned, while other values are shared since they
+        are expected to be immutable.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        clone._attributes = {
+            key: value.clone() if isinstance(value, Classes) else value
+            for key, value in self._attributes.items()
+        }
+        _copy_subclass_state(self, clone, Attributes, memo)
+        return clone
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Gets the state of the object for pickling."""
+        return _get_slot_state(self)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores the state of the object when unpickling."""
+        _set_slot_state(self, state)
+
     def __eq__(self, other: Any) -> bool:
-        """Determines whether two Attributes objects are equal."""
+        """Determines whether two Attributes objects are equal.
+
+        Attributes objects are normalized to their underlying dictionaries so
+        that a single dictionary comparison is performed. Comparisons with
+        other data types are deferred to Python, which treats them as unequal.
+        """
         if isinstance(other, self.__class__):
-            return self._attributes == other._attributes
-        elif isinstance(other, dict):
-            return self._attributes == other
-        return False
+            other = other._attributes
+        elif not isinstance(other, dict):
+            return NotImplemented
+        return self._attributes == other
 
     def __bool__(self) -> bool:
         """Determines whether the instance is empty."""
@@ -306,6 +477,8 @@ class Attributes:
 class Elements:
     """Class for managing HTML elements."""
 
+    __slots__ = ("_elements", "_max_elements", "_valid_types")
+
     def __init__(self, *elements: Element) -> None:
         """Initializes the Elements object."""
 
@@ -313,14 +486,12 @@ class Elements:
         if not all(is_element(e) for e in elements):
             raise TypeError("Elements must be strings or builder objects")
 
-        # Initialize instance variables
-        self._elements: list[Element] = []
+        # Initialize instance variables, loading the elements in one step
+        # since there are no type or size restrictions on a new instance
+        self._elements: list[Element] = list(elements)
         self._max_elements: int | None = None
         self._valid_types: tuple[Type, ...] | None = None
 
-        # Set the elements
-        self.set(*elements)
-
     @property
     def elements(self) -> list[Element]:
         """Gets the stored elements."""
@@ -473,6 +644,14 @@ class Elements:
         """Iterates over the elements in the list."""
         return iter(self._elements)
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Gets the state of the object for pickling."""
+        return _get_slot_state(self)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores the state of the object when unpickling."""
+        _set_slot_state(self, state)
+
     def __eq__(self, other: Any) -> bool:
         """Determines whether two Elements objects are equal."""
         if isinstance(other, self.__class__):
@@ -491,7 +670,10 @@ class Elements:
 
     def __str__(self) -> str:
         """Gets the string version of the object."""
-        return "".join(str(e) for e in self._elements)
+        string = ""
+        for element in self._elements:
+            string += str(element)
+        return string
 
     def __repr__(self) -> str:
         """Gets the string representation of the object."""
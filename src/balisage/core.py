@@ -55,12 +55,16 @@ class HTMLBuilder(ABC):
     @abstractmethod
     def construct(self) -> str:
         """Generates HTML from the stored elements."""
-        attributes_string = f" {self.attributes}" if self.attributes else ""
-        html = f"<{self.tag}{attributes_string}>"
+        elements_string = ""
         for element in self.elements:
-            html += f"{element}"
-        html += f"</{self.tag}>"
-        return html
+            elements_string += str(element)
+        return f"{self._construct_open_tag()}{elements_string}</{self.tag}>"
+
+    def _construct_open_tag(self) -> str:
+        """Generates the opening tag, including any attributes."""
+        if self.attributes:
+            return f"<{self.tag} {self.attributes}>"
+        return f"<{self.tag}>"
 
     @requires_modules("bs4", "bs4.formatter")
     def prettify(self, indent: int = 2) -> str:
@@ -96,11 +100,18 @@ class HTMLBuilder(ABC):
         return self._attributes.classes
 
     def __eq__(self, other: Any) -> bool:
-        """Determines whether two HTMLBuilder objects are equal."""
+        """Determines whether two HTMLBuilder objects are equal.
+
+        Identical objects are equal without comparing their contents, and the
+        elements are only compared if the attributes are equal.
+        """
+        if self is other:
+            return True
         if isinstance(other, self.__class__):
-            attributes_equal = self.attributes == other.attributes
-            elements_equal = self.elements == other.elements
-            return attributes_equal and elements_equal
+            return (
+                self.attributes == other.attributes
+                and self.elements == other.elements
+            )
         return False
 
     def __str__(self) -> str:
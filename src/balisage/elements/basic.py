@@ -127,7 +127,7 @@ class Page(HTMLBuilder):
         # Add the data
         html += "<body>"
         for element in self.elements:
-            html += f"{element}"
+            html += str(element)
         html += "</body>"
 
         # Close the tag and return the HTML
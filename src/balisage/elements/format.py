@@ -28,8 +28,7 @@ class LineBreak(HTMLBuilder):
 
     def construct(self) -> str:
         """Generates HTML from the stored elements."""
-        attributes_string = f" {self.attributes}" if self.attributes else ""
-        return f"<{self.tag}{attributes_string}>"
+        return self._construct_open_tag()
 
 
 class HorizontalRule(LineBreak):
@@ -3,7 +3,7 @@ Contains validation-related code for the package.
 """
 
 import re
-from typing import Any, Type
+from typing import Any, Iterable, Type
 
 # MARK: Types and conversions
 
@@ -63,10 +63,12 @@ def raise_for_type(
 
 # MARK: Classes
 
+_VALID_CLASS_NAME_PATTERN = re.compile(r"^-?[_a-zA-Z]+[_a-zA-Z0-9-]*$")
+
 
 def is_valid_class_name(name: str) -> bool:
     """Determines whether a string is a valid HTML/CSS class name."""
-    return re.match(r"^-?[_a-zA-Z]+[_a-zA-Z0-9-]*$", name) is not None
+    return _VALID_CLASS_NAME_PATTERN.match(name) is not None
 
 
 def sanitize_class_name(
@@ -90,9 +92,40 @@ def sanitize_class_name(
     return name
 
 
+def sanitize_class_names(
+    names: Iterable[str],
+    lower: bool = True,
+    strip: bool = True,
+    replacements: dict[str, str] | None = None,
+) -> list[str]:
+    """Converts multiple class strings into valid class names."""
+    if replacements is None:
+        replacements = {" ": "-"}
+    return [
+        sanitize_class_name(name, lower, strip, replacements) for name in names
+    ]
+
+
 # MARK: Attributes
 
 
+_ATTRIBUTE_PATTERN = re.compile(
+    r"""([^\s=]+)(?:=(?:'([^']*)'|"([^"]*)"|(\S*)))?"""
+)
+
+
 def split_preserving_quotes(string: str) -> list[str]:
     """Splits an attribute string into a list of strings, preserving quotes."""
     return re.findall(r"[^'\s]+='[^']*'|\S+", string)
+
+
+def parse_attribute_string(string: str) -> dict[str, str | bool]:
+    """Parses an attribute string into a dictionary in a single pass.
+
+    Values may be single-quoted, double-quoted, or unquoted. Attributes without
+    a value are treated as boolean attributes and given a value of True.
+    """
+    return {
+        key: single or double or bare or True
+        for key, single, double, bare in _ATTRIBUTE_PATTERN.findall(string)
+    }
@@ -2,8 +2,11 @@
 Contains tests for the attributes module.
 """
 
+import pickle
 import re
 from copy import deepcopy
+from types import MappingProxyType
+from typing import Any, Callable
 
 import pytest
 
@@ -13,33 +16,123 @@ from balisage.elements.image import Image
 from balisage.elements.styles import Div
 from balisage.types import Element
 
+# MARK: Constants
+
+_CLASSES_DICT = MappingProxyType({"class 1": "class-1", "clAss2": "class2"})
+_BASE_CLASSES = Classes("class 1", "class2")
+_EXPECTED_CLASS1 = Classes.from_string("class1")
+_EXPECTED_CLASS1_CLASS2 = Classes.from_string("class1 class-2")
+_BASE_ATTR_DICT = MappingProxyType(
+    {
+        "class": _BASE_CLASSES,
+        "id": "test",
+        "width": 50,
+        "disabled": None,
+        "checked": True,
+        "itemscope": False,
+    }
+)
+
+# Expected rendered strings for the sample fixtures
+_EXPECTED_CLASSES_STR = "class-1 class2"
+_EXPECTED_CONSTRUCT = (
+    "class='class-1 class2' id='test' width='50' disabled checked"
+)
+_EXPECTED_ATTRIBUTES_REPR = (
+    "Attributes(attributes={"
+    "'class': Classes('class 1', 'class2'), "
+    "'id': 'test', "
+    "'width': 50, "
+    "'disabled': None, "
+    "'checked': True, "
+    "'itemscope': False"
+    "})"
+)
+
+# Precompiled error message patterns
+_CLASS_NOT_FOUND = re.compile(
+    r"Class '" + re.escape("cl@ss99") + r"' not found"
+)
+_VALID_CLASS_NOT_FOUND = re.compile(
+    r"Class '" + re.escape("class99") + r"' not found"
+)
+_INVALID_CLASS_NAME_ERR = re.compile(
+    re.escape("Class name 'cl@ss99' (sanitized to 'cl@ss99') is invalid")
+)
+_ATTR_NOT_FOUND = re.compile(
+    r"Attribute '" + re.escape("does-not-exist") + r"' not found"
+)
+_MAX_ELEM_INT_ERR = re.compile(r"max_elements must be an int or None")
+_MAX_ELEM_EXCEEDED_ERR = re.compile(
+    re.escape("3 elements would exceed the maximum number of elements (2)")
+)
+_MAX_ELEM_EXCEEDED_SINGLE_ERR = re.compile(
+    re.escape("1 element would exceed the maximum number of elements (0)")
+)
+_MAX_ELEM_BELOW_CURRENT_ERR = re.compile(
+    re.escape(
+        "max_elements must be greater than or equal to the current "
+        "number of elements (2)"
+    )
+)
+_VALID_TYPES_INT_ERR = re.compile(
+    re.escape("Types of current elements are not one of (int,)")
+)
+_EXPECTED_TYPE_ERR = re.compile(
+    re.escape("Expected a type, got instance of int")
+)
+_LINE_BREAK_NOT_STR_ERR = re.compile(
+    re.escape("Got LineBreak, expected one of (str,)")
+)
+_HORIZONTAL_RULE_NOT_STR_ERR = re.compile(
+    re.escape("Got HorizontalRule, expected one of (str,)")
+)
+
+# MARK: Helpers
+
+
+def _fastcopy(value: Any) -> Any:
+    """Copies an object using a pickle round-trip.
+
+    Pickling is considerably cheaper than deepcopy for simple object graphs,
+    but deepcopy is used as a fallback for objects that can not be pickled.
+    """
+    try:
+        return pickle.loads(pickle.dumps(value, protocol=-1))
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return deepcopy(value)
+
+
 # MARK: Fixtures
 
 
+@pytest.fixture(scope="module")
+def _classes_template() -> Classes:
+    """Creates a sample Classes object once per module."""
+    return Classes("class 1", "clAss2")
+
+
 @pytest.fixture
-def classes() -> Classes:
+def classes(_classes_template: Classes) -> Classes:
     """Creates a sample Classes object."""
-    return Classes("class 1", "clAss2")
+    return _classes_template.clone()
+
+
+@pytest.fixture(scope="module")
+def _attributes_template() -> Attributes:
+    """Creates a sample Attributes object once per module."""
+    return Attributes(dict(_BASE_ATTR_DICT))
 
 
 @pytest.fixture
-def attributes() -> Attributes:
+def attributes(_attributes_template: Attributes) -> Attributes:
     """Creates a sample Attributes object."""
-    return Attributes(
-        {
-            "class": Classes("class 1", "class2"),
-            "id": "test",
-            "width": 50,
-            "disabled": None,
-            "checked": True,
-            "itemscope": False,
-        }
-    )
+    return _attributes_template.clone()
 
 
-@pytest.fixture
-def element_data() -> list[Element]:
-    """Creates a sample list of data."""
+@pytest.fixture(scope="session")
+def _element_data_template() -> list[Element]:
+    """Creates a sample list of data once per session."""
     return [
         Div(
             elements=Elements(
@@ -53,6 +146,16 @@ def element_data() -> list[Element]:
     ]
 
 
+@pytest.fixture
+def element_data(_element_data_template: list[Element]) -> list[Element]:
+    """Creates a sample list of data.
+
+    The elements themselves are shared between tests and must not be mutated;
+    only the returned list is fresh.
+    """
+    return list(_element_data_template)
+
+
 @pytest.fixture
 def elements(element_data: list[Element]) -> Elements:
     """Creates a sample Elements object that has elements."""
@@ -64,7 +167,11 @@ def elements(element_data: list[Element]) -> Elements:
 
 def test_classes_init(classes: Classes) -> None:
     """Tests the initialization of the Classes class."""
-    assert classes.classes == {"class 1": "class-1", "clAss2": "class2"}
+    assert classes.classes == _CLASSES_DICT
+
+    # Verify that the returned mapping can not be modified
+    with pytest.raises(TypeError):
+        classes.classes["class3"] = "class3"
 
 
 def test_classes_from_string() -> None:
@@ -78,16 +185,29 @@ def test_classes_from_string() -> None:
     }
     assert classes.classes == expected
 
+    # Try with irregular whitespace between class names
+    classes = Classes.from_string("  class1\tclass2   Class-3 ")
+    assert classes.classes == {
+        "class1": "class1",
+        "class2": "class2",
+        "Class-3": "class-3",
+    }
+
+    # Verify that repeated strings still produce independent objects
+    first = Classes.from_string("class1 class2")
+    second = Classes.from_string("class1 class2")
+    assert first is not second
+    first.add("class3")
+    assert second.classes == {"class1": "class1", "class2": "class2"}
+    assert str(second) == "class1 class2"
+
 
 def test_classes_replacements(classes: Classes) -> None:
     """Tests the replacements property of the Classes class."""
 
     # Test the default replacements
     expected_replacements = {" ": "-"}
-    expected_classes = {
-        "class 1": "class-1",
-        "clAss2": "class2",
-    }
+    expected_classes = dict(_CLASSES_DICT)
     assert classes.replacements == expected_replacements
     assert classes.classes == expected_classes
 
@@ -101,9 +221,21 @@ def test_classes_replacements(classes: Classes) -> None:
     assert classes.replacements == new_replacements
     assert classes.classes == expected_classes
 
+    # Verify that the set replacements are decoupled from the original
+    new_replacements["b"] = "c"
+    assert classes.replacements == {" ": "_", "a": "zz"}
+
     # Try resetting the replacements
     classes.reset_replacements()
     assert classes.replacements == Classes.DEFAULT_REPLACEMENTS
+    assert classes.replacements is Classes.DEFAULT_REPLACEMENTS
+
+    # Verify that the default replacements can not be modified
+    with pytest.raises(TypeError):
+        Classes.DEFAULT_REPLACEMENTS[" "] = "_"
+
+    # Verify that instances with default replacements can be pickled
+    assert pickle.loads(pickle.dumps(classes)) == classes
 
 
 def test_classes_add(classes: Classes) -> None:
@@ -111,51 +243,29 @@ def test_classes_add(classes: Classes) -> None:
 
     # Try adding a single new class that does not exist
     classes.add("Class 3")
-    expected = {
-        "class 1": "class-1",
-        "clAss2": "class2",
-        "Class 3": "class-3",
-    }
+    expected = {**_CLASSES_DICT, "Class 3": "class-3"}
     assert classes.classes == expected
 
     # Try adding a single class that already exists pre-sanitation
     classes.add("Class 3")
-    expected = {
-        "class 1": "class-1",
-        "clAss2": "class2",
-        "Class 3": "class-3",
-    }
     assert classes.classes == expected
 
     # Try adding a single class that already exists post-sanitation
     classes.add("class-3")
-    expected = {
-        "class 1": "class-1",
-        "clAss2": "class2",
-        "Class 3": "class-3",
-    }
     assert classes.classes == expected
 
     # Try adding new classes with existing names pre-sanitation
     classes.add("class4", "class 1", "Class 5")
-    expected = {
-        "class 1": "class-1",
-        "clAss2": "class2",
-        "Class 3": "class-3",
-        "class4": "class4",
-        "Class 5": "class-5",
-    }
+    expected.update({"class4": "class4", "Class 5": "class-5"})
     assert classes.classes == expected
 
     # Try adding new classes with existing names post-sanitation
     classes.add("class4", "CLASS-1", "Class 5")
-    expected = {
-        "class 1": "class-1",
-        "clAss2": "class2",
-        "Class 3": "class-3",
-        "class4": "class4",
-        "Class 5": "class-5",
-    }
+    assert classes.classes == expected
+
+    # Try adding new classes that are duplicates of each other
+    classes.add("Class 6", "class-6")
+    expected["Class 6"] = "class-6"
     assert classes.classes == expected
 
 
@@ -176,6 +286,10 @@ def test_classes_set(classes: Classes) -> None:
     }
     assert classes.classes == expected
 
+    # Try setting classes that are duplicates post-sanitation
+    classes.set("Class 3", "class-3")
+    assert classes.classes == {"Class 3": "class-3"}
+
     # Try settings with no arguments
     classes.set()
     assert classes.classes == {}
@@ -193,6 +307,14 @@ def test_classes_set(classes: Classes) -> None:
 def test_classes_remove(classes: Classes) -> None:
     """Tests the remove method of the Classes class."""
 
+    # Try removing a class that does not exist from a non-empty instance
+    with pytest.raises(KeyError, match=_VALID_CLASS_NOT_FOUND):
+        classes.remove("class99")
+
+    # Try removing an invalid class name from a non-empty instance
+    with pytest.raises(ValueError, match=_INVALID_CLASS_NAME_ERR):
+        classes.remove("cl@ss99")
+
     # Try removing a class by its pre-sanitized name
     expected_result = classes.remove("class 1")
     expected_classes = {"clAss2": "class2"}
@@ -206,10 +328,8 @@ def test_classes_remove(classes: Classes) -> None:
     assert classes.classes == expected_classes
 
     # Try removing a class that does not exist
-    class_to_remove = "cl@ss99"
-    message = f"Class '{class_to_remove}' not found"
-    with pytest.raises(KeyError, match=message):
-        classes.remove(class_to_remove)
+    with pytest.raises(KeyError, match=_CLASS_NOT_FOUND):
+        classes.remove("cl@ss99")
 
 
 def test_classes_clear(classes: Classes) -> None:
@@ -218,17 +338,77 @@ def test_classes_clear(classes: Classes) -> None:
     assert classes.classes == dict()
 
 
-def test_classes_sanitize_name(classes: Classes) -> None:
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("class 1", "class-1"),
+        ("clAss2", "class2"),
+        ("Class 3", "class-3"),
+        ("  Class   4   ", "class---4"),
+    ],
+)
+def test_classes_sanitize_name(
+    classes: Classes, raw: str, expected: str
+) -> None:
     """Tests the _sanitize_name method of the Classes class."""
-    assert classes._sanitize_name("class 1") == "class-1"
-    assert classes._sanitize_name("clAss2") == "class2"
-    assert classes._sanitize_name("Class 3") == "class-3"
-    assert classes._sanitize_name("  Class   4   ") == "class---4"
+    assert classes._sanitize_name(raw) == expected
 
 
 def test_classes_construct(classes: Classes) -> None:
     """Tests the construct method of the Classes class."""
-    assert classes.construct() == "class-1 class2"
+    assert classes.construct() == _EXPECTED_CLASSES_STR
+
+    # Verify that modifications invalidate the cached class string
+    classes.add("class3")
+    assert classes.construct() == "class-1 class2 class3"
+    classes.remove("class2")
+    assert classes.construct() == "class-1 class3"
+    classes.replacements = {" ": "_"}
+    assert classes.construct() == "class_1 class3"
+    classes.set("class4")
+    assert classes.construct() == "class4"
+    classes.clear()
+    assert classes.construct() == ""
+
+
+def test_classes_clone(classes: Classes) -> None:
+    """Tests the clone and __deepcopy__ methods of the Classes class."""
+    for clone in (classes.clone(), deepcopy(classes)):
+        assert clone == classes
+        assert clone is not classes
+        assert repr(clone) == repr(classes)
+        clone.add("class3")
+        assert clone != classes
+        assert classes.construct() == _EXPECTED_CLASSES_STR
+
+    # Test that custom replacements are not shared with the copies
+    classes = classes.clone()
+    classes.replacements = {" ": "_"}
+    for clone in (classes.clone(), deepcopy(classes)):
+        classes.replacements["x"] = "y"
+        assert "x" not in clone.replacements
+        del classes.replacements["x"]
+
+
+def test_classes_clone_subclass() -> None:
+    """Tests that copies of Classes subclasses keep additional state."""
+
+    class TaggedClasses(Classes):
+        __slots__ = ("tag",)
+
+    classes = TaggedClasses("class 1")
+    classes.tag = ["tag"]
+    for clone in (classes.clone(), deepcopy(classes)):
+        assert type(clone) is TaggedClasses
+        assert clone == classes
+        assert clone.tag == ["tag"]
+        assert clone.tag is not classes.tag
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_classes_pickle(classes: Classes, protocol: int) -> None:
+    """Tests that the Classes class can be pickled with every protocol."""
+    assert pickle.loads(pickle.dumps(classes, protocol=protocol)) == classes
 
 
 def test_classes_eq(classes: Classes) -> None:
@@ -247,15 +427,12 @@ def test_classes_eq(classes: Classes) -> None:
     assert classes == {"class 1": "class-1", "class2": "class2"}
     assert classes == {"class-1": "class-1", "class2": "class2"}
 
-    # Try comparing the classes object to other data types
-    assert classes != 1
-    assert classes != 2.0
-    assert classes is not True
-    assert classes is not False
-    assert classes != tuple()
-    assert classes != list()
-    assert classes != dict()
-    assert classes is not None
+
+def test_classes_ne_other_types(
+    classes: Classes, non_equal_value: Any
+) -> None:
+    """Tests the __eq__ method of the Classes class with other data types."""
+    assert classes != non_equal_value
 
 
 def test_classes_bool(classes: Classes) -> None:
@@ -266,30 +443,31 @@ def test_classes_bool(classes: Classes) -> None:
 
 def test_classes_str(classes: Classes) -> None:
     """Tests the __str__ method of the Classes class."""
-    assert str(classes) == "class-1 class2"
+    assert str(classes) == _EXPECTED_CLASSES_STR
 
 
 def test_classes_repr(classes: Classes) -> None:
     """Tests the __repr__ method of the Classes class."""
     assert repr(classes) == "Classes('class 1', 'clAss2')"
 
+    # Verify that modifications invalidate the cached representation
+    classes.add("Class 3")
+    assert repr(classes) == "Classes('class 1', 'clAss2', 'Class 3')"
+    classes.remove("class2")
+    assert repr(classes) == "Classes('class 1', 'Class 3')"
+    classes.replacements = {" ": "_"}
+    assert repr(classes) == "Classes('class 1', 'Class 3')"
+    classes.clear()
+    assert repr(classes) == "Classes()"
+
 
 # MARK: Attributes
 
 
 def test_attributes_init(attributes: Attributes) -> None:
     """Tests the initialization of the Attributes class."""
-    expected_classes = Classes("class 1", "class2")
-    expected_attributes = {
-        "class": expected_classes,
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-    }
-    assert attributes.attributes == expected_attributes
-    assert attributes.classes == expected_classes
+    assert attributes.attributes == _BASE_ATTR_DICT
+    assert attributes.classes == _BASE_CLASSES
 
 
 def test_attributes_from_string() -> None:
@@ -303,32 +481,36 @@ def test_attributes_from_string() -> None:
     }
     assert attributes.attributes == expected
 
+    # Try with double-quoted and unquoted values
+    string = 'class="class-1 class2" id=test-1 disabled'
+    attributes = Attributes.from_string(string)
+    assert attributes.attributes == expected
+
+    # Verify that repeated strings still produce independent objects
+    other = Attributes.from_string(string)
+    other["id"] = "test-2"
+    other.classes.add("class3")
+    assert Attributes.from_string(string).attributes == expected
+
 
 def test_attributes_attributes(attributes: Attributes) -> None:
     """Tests the attributes property of the Attributes class."""
-    expected = {
-        "class": Classes("class 1", "class2"),
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-    }
-    assert attributes.attributes == expected
+    assert attributes.attributes == _BASE_ATTR_DICT
 
 
 def test_attributes_classes(attributes: Attributes) -> None:
     """Tests the attributes property of the Attributes class."""
 
     # Test setting classes as a string
-    expected = {"class1": "class1"}
     attributes.classes = "class1"
-    assert attributes.classes == Classes(*expected.keys())
-    assert attributes.classes.classes == expected
-    expected = {"class1": "class1", "class-2": "class-2"}
+    assert attributes.classes == _EXPECTED_CLASS1
+    assert attributes.classes.classes == {"class1": "class1"}
     attributes.classes = "class1 class-2"
-    assert attributes.classes == Classes(*expected.keys())
-    assert attributes.classes.classes == expected
+    assert attributes.classes == _EXPECTED_CLASS1_CLASS2
+    assert attributes.classes.classes == {
+        "class1": "class1",
+        "class-2": "class-2",
+    }
 
     # Test setting classes as a Classes object
     expected = {
@@ -341,97 +523,67 @@ def test_attributes_classes(attributes: Attributes) -> None:
     assert attributes.classes == expected
     assert attributes.classes.classes == expected
 
-    # Test setting classes as a list of strings
-    invalid_value = ["class 1", "class2", "Class 3", "cLass4"]
-    message = "Arguments passed to set must be strings"
-    with pytest.raises(TypeError, match=message):
-        attributes.classes = invalid_value
-
-    # Test setting classes as other data types
-    for invalid_value in [True, False, None, 1, 2.0, tuple(), list(), dict()]:
-        with pytest.raises(TypeError, match=message):
-            attributes.classes = invalid_value
-
     # Test with a default instance
     attributes = Attributes()
     assert attributes.classes == Classes()
 
 
+@pytest.mark.parametrize(
+    "invalid_value",
+    [
+        ["class 1", "class2", "Class 3", "cLass4"],
+        True,
+        False,
+        None,
+        1,
+        2.0,
+        (),
+        [],
+        {},
+    ],
+)
+def test_attributes_classes_invalid_setter(
+    attributes: Attributes, invalid_value: Any
+) -> None:
+    """Tests setting the classes property to invalid data types."""
+    message = "Arguments passed to set must be strings"
+    with pytest.raises(TypeError, match=message):
+        attributes.classes = invalid_value
+
+
 def test_attributes_add(attributes: Attributes) -> None:
     """Tests the add method of the Attributes class."""
 
-    expected_classes = Classes("class 1", "class2")
+    # Existing attributes are never overwritten by the add method
+    expected_attributes = dict(_BASE_ATTR_DICT)
 
     # Try adding a single new attribute that does not exist
     attributes.add({"required": True})
-    expected_attributes = {
-        "class": expected_classes,
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-        "required": True,
-    }
+    expected_attributes["required"] = True
     assert attributes.attributes == expected_attributes
 
     # Try adding a single attribute that already exists
     attributes.add({"checked": False})
-    expected_attributes = {
-        "class": expected_classes,
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-        "required": True,
-    }
+    expected_attributes.setdefault("checked", False)
     assert attributes.attributes == expected_attributes
 
     # Try adding multiple new attributes that already exist
     attributes.add({"itemscope": None, "disabled": None})
-    expected_attributes = {
-        "class": expected_classes,
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-        "required": True,
-    }
+    expected_attributes.setdefault("itemscope", None)
+    expected_attributes.setdefault("disabled", None)
     assert attributes.attributes == expected_attributes
 
     # Try adding multiple new attributes that do not exist
     attributes.add({"height": 50, "open": True, "alt": "Alternate text"})
-    expected_attributes = {
-        "class": expected_classes,
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-        "required": True,
-        "height": 50,
-        "open": True,
-        "alt": "Alternate text",
-    }
+    expected_attributes["height"] = 50
+    expected_attributes["open"] = True
+    expected_attributes["alt"] = "Alternate text"
     assert attributes.attributes == expected_attributes
 
     # Try adding a mix of new and existing attributes
     attributes.add({"checked": False, "title": "Title text"})
-    expected_attributes = {
-        "class": expected_classes,
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-        "required": True,
-        "height": 50,
-        "open": True,
-        "alt": "Alternate text",
-        "title": "Title text",
-    }
+    expected_attributes.setdefault("checked", False)
+    expected_attributes["title"] = "Title text"
     assert attributes.attributes == expected_attributes
 
     # Try adding a string to a fresh instance
@@ -468,15 +620,9 @@ def test_attributes_set(attributes: Attributes) -> None:
     assert attributes.attributes == expected
 
     # Test with classes passes as a Classes object
-    expected = {
-        "class": Classes("class 1", "class2"),
-        "id": "test",
-        "width": 75,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-        "alt": "Attributes test",
-    }
+    expected = dict(_BASE_ATTR_DICT)
+    expected["width"] = 75
+    expected["alt"] = "Attributes test"
     attributes.set(expected)
     assert attributes.attributes == expected
 
@@ -492,17 +638,11 @@ def test_attributes_remove(attributes: Attributes) -> None:
     """Tests the remove method of the Attributes class."""
 
     # Try removing an attribute by its name
-    expected_classes = Classes("class 1", "class2")
-    expected_attributes = {
-        "class": expected_classes,
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-    }
+    expected_attributes = dict(_BASE_ATTR_DICT)
+    del expected_attributes["id"]
     attributes.remove("id")
     assert attributes.attributes == expected_attributes
-    assert attributes.classes == expected_classes
+    assert attributes.classes == _BASE_CLASSES
 
     # Try removing the class attributes
     attributes.remove("class")
@@ -511,10 +651,8 @@ def test_attributes_remove(attributes: Attributes) -> None:
     assert attributes.classes == Classes()
 
     # Try removing an attribute that does not exist
-    attribute_to_remove = "does-not-exist"
-    message = f"Attribute '{attribute_to_remove}' not found"
-    with pytest.raises(KeyError, match=message):
-        attributes.remove(attribute_to_remove)
+    with pytest.raises(KeyError, match=_ATTR_NOT_FOUND):
+        attributes.remove("does-not-exist")
 
 
 def test_attributes_clear(attributes: Attributes) -> None:
@@ -525,13 +663,53 @@ def test_attributes_clear(attributes: Attributes) -> None:
     assert attributes.classes == Classes()
 
 
+def test_attributes_clone(attributes: Attributes) -> None:
+    """Tests the clone and __deepcopy__ methods of the Attributes class."""
+    for clone in (attributes.clone(), deepcopy(attributes)):
+        assert clone == attributes
+        assert clone is not attributes
+        assert clone.classes is not attributes.classes
+        clone.add({"required": True})
+        clone.classes.add("class3")
+        assert clone != attributes
+        assert attributes.construct() == _EXPECTED_CONSTRUCT
+
+
+def test_attributes_clone_subclass() -> None:
+    """Tests that copies of Attributes subclasses keep additional state."""
+
+    class TaggedAttributes(Attributes):
+        pass
+
+    attributes = TaggedAttributes({"id": "test"})
+    attributes.tags = ["tag"]
+    attributes.owner = attributes
+    for clone in (attributes.clone(), deepcopy(attributes)):
+        assert type(clone) is TaggedAttributes
+        assert clone == attributes
+        assert clone.tags == ["tag"]
+        assert clone.tags is not attributes.tags
+        assert clone.owner is clone
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_attributes_pickle(attributes: Attributes, protocol: int) -> None:
+    """Tests that the Attributes class can be pickled with every protocol."""
+    assert (
+        pickle.loads(pickle.dumps(attributes, protocol=protocol)) == attributes
+    )
+
+
 def test_attributes_construct(attributes: Attributes) -> None:
     """Tests the construct method of the Attributes class."""
-    assert attributes.construct() == (
-        "class='class-1 class2' id='test' width='50' disabled checked"
-    )
+    assert attributes.construct() == _EXPECTED_CONSTRUCT
     assert Attributes().construct() == ""
 
+    # Verify that changes to a retrieved dictionary are reflected
+    dictionary = attributes.attributes
+    dictionary["id"] = "kept"
+    assert "id='kept'" in attributes.construct()
+
 
 def test_attributes_get_set(attributes: Attributes) -> None:
     """Tests the __getitem__ and __setitem__ methods of the Attributes class."""
@@ -570,31 +748,25 @@ def test_attributes_get_set(attributes: Attributes) -> None:
         attributes["id"]
 
 
-def test_attributes_eq(attributes: Attributes) -> None:
-    """Tests the __eq__ method of the Attributes class."""
-
-    # Try comparing the attributes object to itself
+def test_attributes_eq_identity(attributes: Attributes) -> None:
+    """Tests comparing an Attributes object to itself."""
     assert attributes == attributes
 
-    # Try comparing the attributes object to one with the same values
-    expected = Attributes(
-        {
-            "class": Classes("class 1", "class2"),
-            "id": "test",
-            "width": 50,
-            "disabled": None,
-            "checked": True,
-            "itemscope": False,
-        }
-    )
-    assert attributes == expected
 
-    # Try comparing the attributes object to itself with values changed
-    expected = deepcopy(attributes)
+def test_attributes_eq_same_values(attributes: Attributes) -> None:
+    """Tests comparing an Attributes object to one with the same values."""
+    assert attributes == Attributes(dict(_BASE_ATTR_DICT))
+
+
+def test_attributes_eq_mutated(attributes: Attributes) -> None:
+    """Tests comparing an Attributes object to a modified copy of itself."""
+    expected = attributes.clone()
     expected.add({"required": True})
     assert attributes != expected
 
-    # Try comparing the attributes object to one with different values
+
+def test_attributes_eq_different(attributes: Attributes) -> None:
+    """Tests comparing an Attributes object to one with different values."""
     expected = Attributes(
         {
             "class": Classes("class 1", "class2", "class3"),
@@ -608,26 +780,17 @@ def test_attributes_eq(attributes: Attributes) -> None:
     )
     assert attributes != expected
 
-    # Try comparing the attributes object to a dictionary
-    expected = {
-        "class": Classes("class 1", "class2"),
-        "id": "test",
-        "width": 50,
-        "disabled": None,
-        "checked": True,
-        "itemscope": False,
-    }
-    assert attributes == expected
 
-    # Try comparing the attributes object to other data types
-    assert attributes != 1
-    assert attributes != 2.0
-    assert attributes is not True
-    assert attributes is not False
-    assert attributes != tuple()
-    assert attributes != list()
-    assert attributes != dict()
-    assert attributes is not None
+def test_attributes_eq_dict(attributes: Attributes) -> None:
+    """Tests comparing an Attributes object to a dictionary."""
+    assert attributes == dict(_BASE_ATTR_DICT)
+
+
+def test_attributes_ne_other_types(
+    attributes: Attributes, non_equal_value: Any
+) -> None:
+    """Tests the __eq__ method of the Attributes class with other types."""
+    assert attributes != non_equal_value
 
 
 def test_attributes_bool(attributes: Attributes) -> None:
@@ -647,25 +810,14 @@ def test_attributes_bool(attributes: Attributes) -> None:
 
 def test_attributes_str(attributes: Attributes) -> None:
     """Tests the __str__ method of the Attributes class."""
-    expected = "class='class-1 class2' id='test' width='50' disabled checked"
-    assert str(attributes) == expected
+    assert str(attributes) == _EXPECTED_CONSTRUCT
 
 
 def test_attributes_repr(attributes: Attributes) -> None:
     """Tests the __repr__ method of the Attributes class."""
 
     # Test using the fixture
-    expected = (
-        "Attributes(attributes={"
-        "'class': Classes('class 1', 'class2'), "
-        "'id': 'test', "
-        "'width': 50, "
-        "'disabled': None, "
-        "'checked': True, "
-        "'itemscope': False"
-        "})"
-    )
-    assert repr(attributes) == expected
+    assert repr(attributes) == _EXPECTED_ATTRIBUTES_REPR
 
     # Test with no attributes
     attributes = Attributes()
@@ -678,33 +830,31 @@ def test_attributes_repr(attributes: Attributes) -> None:
 def test_elements_init(
     elements: Elements, element_data: list[Element]
 ) -> None:
-    """Tests the initialization of the Elements class."""
-
-    # Test with only builder elements
-    expected = element_data
-    assert elements.elements == expected
+    """Tests the initialization of the Elements class with builder elements."""
+    assert elements.elements == element_data
 
-    # Test with only one string
-    expected = "String 1"
-    elements = Elements(expected)
-    assert elements.elements == [expected]
 
-    # Test with multiple strings
-    expected = ["String 1", "String 2"]
+@pytest.mark.parametrize(
+    "expected",
+    [
+        ["String 1"],
+        ["String 1", "String 2"],
+        ["String 1", HorizontalRule()],
+    ],
+    ids=["one-string", "strings", "mixed"],
+)
+def test_elements_init_other_data(expected: list[Element]) -> None:
+    """Tests the initialization of the Elements class with other data."""
     elements = Elements(*expected)
     assert elements.elements == expected
 
-    # Test with both builder and string elements
-    expected = ["String 1", HorizontalRule()]
-    elements = Elements(*expected)
-    assert elements.elements == expected
 
-    # Test with invalid data types
-    invalid_values = [1, 2.0, True, False, tuple(), dict(), None]
+@pytest.mark.parametrize("invalid_value", [1, 2.0, True, False, (), {}, None])
+def test_elements_init_invalid(invalid_value: Any) -> None:
+    """Tests initializing the Elements class with invalid data types."""
     message = "Elements must be strings or builder objects"
-    for invalid_value in invalid_values:
-        with pytest.raises(TypeError, match=message):
-            Elements(invalid_value)
+    with pytest.raises(TypeError, match=message):
+        Elements(invalid_value)
 
 
 def test_elements_max_elements(elements: Elements) -> None:
@@ -719,13 +869,6 @@ def test_elements_max_elements(elements: Elements) -> None:
     # Verify that a new instance's max elements is None
     assert Elements().max_elements is None
 
-    # Set max elements to a value that is not an int or None
-    message = "max_elements must be an int or None"
-    test_values = ["10", 10.0, True, False, tuple(), list(), dict()]
-    for test_value in test_values:
-        with pytest.raises(TypeError, match=message):
-            elements.max_elements = test_value
-
     # Set max elements to a negative value
     message = "max_elements must be a positive integer"
     with pytest.raises(ValueError, match=message):
@@ -735,52 +878,61 @@ def test_elements_max_elements(elements: Elements) -> None:
     elements.max_elements = 2
 
     # Set max elements to a value less than the current number of elements
-    message = (
-        "max_elements must be greater than or equal to the current "
-        "number of elements (2)"
-    )
-    with pytest.raises(ValueError, match=re.escape(message)):
+    with pytest.raises(ValueError, match=_MAX_ELEM_BELOW_CURRENT_ERR):
         elements.max_elements = 1
 
 
+@pytest.mark.parametrize("bad", ["10", 10.0, True, False, (), [], {}])
+def test_elements_max_elements_invalid_type(
+    elements: Elements, bad: Any
+) -> None:
+    """Tests setting the max_elements property to invalid data types."""
+    with pytest.raises(TypeError, match=_MAX_ELEM_INT_ERR):
+        elements.max_elements = bad
+
+
 def test_elements_valid_types(elements: Elements) -> None:
     """Tests the valid_types property of the Elements class."""
 
     # Try setting valid_types to types incompatible with the current elements
-    message = "Types of current elements are not one of (int,)"
-    with pytest.raises(TypeError, match=re.escape(message)):
+    with pytest.raises(TypeError, match=_VALID_TYPES_INT_ERR):
         elements.valid_types = int
 
     # Test the default valid_types and clear the elements
     elements.clear()
     assert elements.valid_types is None
 
-    # Set valid_types to something valid
-    for test_value, expected_value in [
-        (int, (int,)),
-        ([int], (int,)),
-        ((int,), (int,)),
-        ([int, str], (int, str)),
-        ((int, str), (int, str)),
-    ]:
-        elements.valid_types = test_value
-        assert elements.valid_types == expected_value
-
-    # Set valid_types to None again
+    # Set valid_types and then remove the type restriction
+    elements.valid_types = int
     elements.valid_types = None
     assert elements.valid_types is None
 
-    # Set valid_types to empty lists and tuples
-    for test_value in [tuple(), list()]:
-        elements.valid_types = test_value
-        assert elements.valid_types is None
-
     # Set valid_types to an invalid value
-    message = "Expected a type, got instance of int"
-    with pytest.raises(TypeError, match=re.escape(message)):
+    with pytest.raises(TypeError, match=_EXPECTED_TYPE_ERR):
         elements.valid_types = 1
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (int, (int,)),
+        ([int], (int,)),
+        ((int,), (int,)),
+        ([int, str], (int, str)),
+        ((int, str), (int, str)),
+        ((), None),
+        ([], None),
+    ],
+)
+def test_elements_valid_types_setter(
+    value: Any, expected: tuple[type, ...] | None
+) -> None:
+    """Tests setting the valid_types property to valid values."""
+    elements = Elements()
+    elements.valid_types = value
+    assert elements.valid_types == expected
+
+
 def test_elements_add(elements: Elements, element_data: list[Element]) -> None:
     """Tests the add method of the Elements class."""
 
@@ -804,8 +956,7 @@ def test_elements_add(elements: Elements, element_data: list[Element]) -> None:
     assert elements.elements == [new_element]
 
     # Try adding new elements that are not allowed
-    message = "Got LineBreak, expected one of (str,)"
-    with pytest.raises(TypeError, match=re.escape(message)):
+    with pytest.raises(TypeError, match=_LINE_BREAK_NOT_STR_ERR):
         elements.add(LineBreak())
 
 
@@ -845,8 +996,7 @@ def test_elements_set(elements: Elements) -> None:
     assert elements.elements == [new_data]
 
     # Try setting new elements that are not allowed
-    message = "Got LineBreak, expected one of (str,)"
-    with pytest.raises(TypeError, match=re.escape(message)):
+    with pytest.raises(TypeError, match=_LINE_BREAK_NOT_STR_ERR):
         elements.set(LineBreak())
 
 
@@ -855,9 +1005,9 @@ def test_elements_insert(
 ) -> None:
     """Tests the insert method of the Elements class."""
     new_element = HorizontalRule()
-    element_data.insert(1, new_element)
+    expected_data = [element_data[0], new_element, *element_data[1:]]
     elements.insert(1, new_element)
-    assert elements.elements == element_data
+    assert elements.elements == expected_data
 
     # Try inserting elements that are allowed
     elements.clear()
@@ -870,8 +1020,7 @@ def test_elements_insert(
     assert elements.elements == expected_data
 
     # Try inserting elements that are not allowed
-    message = "Got LineBreak, expected one of (str,)"
-    with pytest.raises(TypeError, match=re.escape(message)):
+    with pytest.raises(TypeError, match=_LINE_BREAK_NOT_STR_ERR):
         elements.insert(1, LineBreak())
 
 
@@ -880,8 +1029,7 @@ def test_elements_update(
 ) -> None:
     """Tests the update method of the Elements class."""
     new_element = HorizontalRule()
-    expected_data = element_data
-    expected_data[0] = new_element
+    expected_data = [new_element, *element_data[1:]]
     elements.update(0, new_element)
     assert elements.elements[0] == new_element
     assert elements.elements == expected_data
@@ -900,8 +1048,7 @@ def test_elements_update(
     assert len(elements.elements) == 2
 
     # Try updating with elements that are not allowed
-    message = "Got HorizontalRule, expected one of (str,)"
-    with pytest.raises(TypeError, match=re.escape(message)):
+    with pytest.raises(TypeError, match=_HORIZONTAL_RULE_NOT_STR_ERR):
         elements.update(0, HorizontalRule())
 
 
@@ -923,12 +1070,13 @@ def test_elements_remove(
 
 def test_elements_pop(elements: Elements, element_data: list[Element]) -> None:
     """Tests the pop method of the Elements class."""
+    initial_length = len(element_data)
 
     # Pop with an integer argument
     popped_element = elements.pop(0)
     assert popped_element == element_data[0]
     assert elements.elements == element_data[1:]
-    assert len(elements.elements) == (len(element_data) - 1)
+    assert len(elements.elements) == initial_length - 1
 
     # Pop with a non-integer argument
     with pytest.raises(TypeError):
@@ -938,7 +1086,7 @@ def test_elements_pop(elements: Elements, element_data: list[Element]) -> None:
     popped_element = elements.pop()
     assert popped_element == element_data[-1]
     assert elements.elements == []
-    assert len(elements.elements) == (len(element_data) - 2)
+    assert len(elements.elements) == initial_length - 2
 
 
 def test_elements_clear(elements: Elements) -> None:
@@ -948,30 +1096,31 @@ def test_elements_clear(elements: Elements) -> None:
     assert len(elements.elements) == 0
 
 
-def test_elements_raise_if_exceeds_max_elements(elements: Elements) -> None:
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda elements: elements.add(LineBreak()),
+        lambda elements: elements.insert(0, LineBreak()),
+        lambda elements: elements.set(LineBreak(), HorizontalRule(), Div()),
+    ],
+    ids=["add", "insert", "set"],
+)
+def test_elements_raise_if_exceeds_max_elements(
+    elements: Elements, operation: Callable[[Elements], None]
+) -> None:
     """Tests the _raise_if_exceeds_max_elements method of the Elements class."""
-
-    # Try adding a new element to exceed max_elements
     elements.max_elements = 2
-    message = "3 elements would exceed the maximum number of elements (2)"
-    with pytest.raises(ValueError, match=re.escape(message)):
-        elements.add(LineBreak())
-
-    # Try inserting a new element to exceed max_elements
-    message = "3 elements would exceed the maximum number of elements (2)"
-    with pytest.raises(ValueError, match=re.escape(message)):
-        elements.insert(0, LineBreak())
+    with pytest.raises(ValueError, match=_MAX_ELEM_EXCEEDED_ERR):
+        operation(elements)
 
-    # Try setting new elements to exceed max_elements
-    message = "3 elements would exceed the maximum number of elements (2)"
-    with pytest.raises(ValueError, match=re.escape(message)):
-        elements.set(LineBreak(), HorizontalRule(), Div())
 
-    # Test different versions of pluralization in the error message
+def test_elements_raise_if_exceeds_max_elements_plural(
+    elements: Elements,
+) -> None:
+    """Tests the pluralization of the max elements error message."""
     elements.clear()
     elements.max_elements = 0
-    message = "1 element would exceed the maximum number of elements (0)"
-    with pytest.raises(ValueError, match=re.escape(message)):
+    with pytest.raises(ValueError, match=_MAX_ELEM_EXCEEDED_SINGLE_ERR):
         elements.add(LineBreak())
 
 
@@ -980,8 +1129,7 @@ def test_elements_get_set(
 ) -> None:
     """Tests the __getitem__ and __setitem__ methods of the Elements class."""
     new_element = HorizontalRule()
-    expected_data = element_data
-    expected_data[0] = new_element
+    expected_data = [new_element, *element_data[1:]]
     elements[0] = new_element
     assert elements[0] == new_element
     assert elements.elements == expected_data
@@ -992,22 +1140,26 @@ def test_elements_iter(
     elements: Elements, element_data: list[Element]
 ) -> None:
     """Tests the __iter__ method of the Elements class."""
+    assert list(elements) == element_data
 
-    # Test with builder elements
-    for actual_element, expected_element in zip(elements, element_data):
-        assert actual_element == expected_element
 
-    # Test with strings
-    element_data = ["String 1", "String 2"]
-    elements = Elements(*element_data)
-    for actual_element, expected_element in zip(elements, element_data):
-        assert actual_element == expected_element
+@pytest.mark.parametrize(
+    "data",
+    [["String 1", "String 2"], ["String 1", HorizontalRule()]],
+    ids=["strings", "mixed"],
+)
+def test_elements_iter_other_data(data: list[Element]) -> None:
+    """Tests the __iter__ method of the Elements class with other data."""
+    assert list(Elements(*data)) == data
 
-    # Test with mixed elements
-    element_data = ["String 1", HorizontalRule()]
-    elements = Elements(*element_data)
-    for actual_element, expected_element in zip(elements, element_data):
-        assert actual_element == expected_element
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_elements_pickle(elements: Elements, protocol: int) -> None:
+    """Tests that the Elements class can be pickled with every protocol."""
+    elements.max_elements = 5
+    unpickled = pickle.loads(pickle.dumps(elements, protocol=protocol))
+    assert unpickled == elements
+    assert unpickled.max_elements == 5
 
 
 def test_elements_eq(elements: Elements, element_data: list[Element]) -> None:
@@ -1021,40 +1173,38 @@ def test_elements_eq(elements: Elements, element_data: list[Element]) -> None:
     assert elements == expected
 
     # Try comparing the elements object to itself with values changed
-    expected = deepcopy(elements)
+    expected = _fastcopy(elements)
     expected.add(HorizontalRule())
     assert elements != expected
 
-    # Try comparing the elements object to one with different values
-    expected = Elements(HorizontalRule(), LineBreak())
-    assert elements != expected
-
-    # Try comparing the elements object to one with only strings
-    expected = Elements("Test string 1", "Test string 2")
-    assert elements != expected
-
-    # Try comparing the elements object to one with strings and elements
-    expected = Elements("Test string 1", LineBreak())
-    assert elements != expected
+    # Try comparing a mix of strings and elements to an equivalent list
     assert Elements("Test string", LineBreak()) == ["Test string", LineBreak()]
 
-    # Try comparing the elements object to a list of strings and elements
-    expected = ["Test string 1", LineBreak()]
-    assert elements != expected
-
     # Try comparing the elements object to a list of elements
     assert elements == element_data
 
-    # Try comparing the elements object to other data types
-    assert elements != "Test string"
-    assert elements != 1
-    assert elements != 2.0
-    assert elements is not True
-    assert elements is not False
-    assert elements != tuple()
-    assert elements != list()
-    assert elements != dict()
-    assert elements is not None
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        Elements(HorizontalRule(), LineBreak()),
+        Elements("Test string 1", "Test string 2"),
+        Elements("Test string 1", LineBreak()),
+        ["Test string 1", LineBreak()],
+        "Test string",
+    ],
+    ids=["elements", "strings", "mixed", "mixed-list", "string"],
+)
+def test_elements_ne_different(elements: Elements, other: Any) -> None:
+    """Tests comparing an Elements object to ones with different values."""
+    assert elements != other
+
+
+def test_elements_ne_other_types(
+    elements: Elements, non_equal_value: Any
+) -> None:
+    """Tests the __eq__ method of the Elements class with other data types."""
+    assert elements != non_equal_value
 
 
 def test_elements_bool(elements: Elements) -> None:
@@ -1067,14 +1217,6 @@ def test_elements_len(elements: Elements) -> None:
     """Tests the __len__ method of the Elements class."""
     assert len(elements) == len(elements.elements)
     assert len(elements) == 2
-    assert len(elements) != 3
-    assert len(elements) != 1.0
-    assert len(elements) != list()
-    assert len(elements) != tuple()
-    assert len(elements) != dict()
-    assert len(elements) is not True
-    assert len(elements) is not False
-    assert len(elements) is not None
 
 
 def test_elements_str(elements: Elements) -> None:
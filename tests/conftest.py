@@ -0,0 +1,15 @@
+"""
+Contains shared configuration for the tests.
+"""
+
+import pytest
+
+# Values of other data types that should never compare equal to the objects
+# under test
+NON_EQUAL_VALUES = [1, 2.0, True, False, (), [], {}, None]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrizes tests that take a non_equal_value argument."""
+    if "non_equal_value" in metafunc.fixturenames:
+        metafunc.parametrize("non_equal_value", NON_EQUAL_VALUES)
@@ -2,9 +2,9 @@
 Contains tests for the core module.
 """
 
-import os
+import importlib.util
 import pathlib
-from copy import deepcopy
+from typing import Any
 
 import pytest
 
@@ -16,27 +16,111 @@ from balisage.elements.image import Image
 from balisage.elements.styles import Div
 from balisage.elements.text import Heading1, Paragraph
 
-# Determine if beautifulsoup4 is installed
-try:
-    import bs4  # noqa: F401
+# Determine if beautifulsoup4 is installed without importing it
+BS4_INSTALLED = importlib.util.find_spec("bs4") is not None
+
+# Directory containing the expected output files
+DATA_DIRECTORY = pathlib.Path(__file__).parent.resolve() / "_data"
+
+# Empty containers to compare against; these must never be modified
+EMPTY_ATTRIBUTES = Attributes()
+EMPTY_CLASSES = Classes()
+EMPTY_ELEMENTS = Elements()
+
+# Expected rendered string for the generic element fixture
+_EXPECTED_GENERIC_ELEMENT_HTML = (
+    "<div id='test' disabled class='class-1 class2'>"
+    "<img src='image1.png'>"
+    "<br>"
+    "<img src='image2.png' alt='Image 2'>"
+    "</div>"
+)
+
+# MARK: Helpers
+
+
+def _clone(builder: HTMLBuilder) -> HTMLBuilder:
+    """Creates a copy of a builder that can be modified independently.
+
+    Only the builder's own elements list and attributes are copied; the child
+    elements themselves are shared with the original.
+    """
+    return type(builder)(
+        elements=Elements(*builder.elements),
+        attributes=builder.attributes.clone(),
+    )
 
-    BS4_INSTALLED = True
-except ImportError:
-    BS4_INSTALLED = False
 
 # MARK: Fixtures
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def builder() -> HTMLBuilder:
-    """Creates a sample HTMLBuilder object with some attributes."""
+    """Creates a sample HTMLBuilder object with some attributes.
+
+    The object is shared by the tests in this module, so tests that need to
+    modify it must work on a copy made with _clone.
+    """
     attributes = {"id": "test", "disabled": True}
-    return HTMLBuilder(
-        elements=Elements(LineBreak(), HorizontalRule()),
-        attributes=Attributes(attributes),
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(HTMLBuilder, "__abstractmethods__", frozenset())
+        return HTMLBuilder(
+            elements=Elements(LineBreak(), HorizontalRule()),
+            attributes=Attributes(attributes),
+        )
+
+
+@pytest.fixture(scope="session")
+def prettify_expected() -> dict[int, str]:
+    """Reads the expected prettify output for each indent once per session."""
+    return {
+        indent: (DATA_DIRECTORY / f"prettify_indent_{indent}.html").read_text(
+            encoding="utf-8"
+        )
+        for indent in (0, 2, 4)
+    }
+
+
+@pytest.fixture(scope="module")
+def prettify_page() -> Page:
+    """Creates a sample Page object for the prettify tests."""
+    return Page(
+        elements=Elements(
+            Heading1("Test heading"),
+            HorizontalRule(),
+            Div(
+                elements=Elements(
+                    Paragraph("Test paragraph 1"),
+                    LineBreak(),
+                    Paragraph("Test paragraph 2"),
+                )
+            ),
+        ),
+        title="Test title",
     )
 
 
+@pytest.fixture
+def concrete_html_builder(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Allows the abstract HTMLBuilder class to be instantiated directly."""
+    monkeypatch.setattr(HTMLBuilder, "__abstractmethods__", frozenset())
+
+
+@pytest.fixture
+def saving_builder(
+    monkeypatch: pytest.MonkeyPatch, concrete_html_builder: None
+) -> HTMLBuilder:
+    """Creates an HTMLBuilder object with a fixed construct method."""
+    monkeypatch.setattr(
+        HTMLBuilder,
+        "construct",
+        lambda _: (
+            "<!DOCTYPE html><html><body><p>Test paragraph</p></body></html>"
+        ),
+    )
+    return HTMLBuilder()
+
+
 @pytest.fixture
 def sample_elements() -> Elements:
     """Creates a sample list of data."""
@@ -61,23 +145,21 @@ def generic_element(sample_elements: Elements) -> GenericElement:
 # MARK: HTMLBuilder
 
 
+@pytest.mark.usefixtures("concrete_html_builder")
 def test_html_builder_init() -> None:
     """Tests the initialization of the HTMLBuilder class."""
 
-    # Override the abstract methods
-    HTMLBuilder.__abstractmethods__ = set()
-
     # Pass nothing
     builder = HTMLBuilder()
-    assert builder.attributes == Attributes()
-    assert builder.classes == Classes()
-    assert builder.elements == Elements()
+    assert builder.attributes == EMPTY_ATTRIBUTES
+    assert builder.classes == EMPTY_CLASSES
+    assert builder.elements == EMPTY_ELEMENTS
 
     # Pass attributes
     builder = HTMLBuilder(attributes=Attributes({"id": "test"}))
     assert builder.attributes == Attributes({"id": "test"})
-    assert builder.classes == Classes()
-    assert builder.elements == Elements()
+    assert builder.classes == EMPTY_CLASSES
+    assert builder.elements == EMPTY_ELEMENTS
 
     # Pass classes via attributes argument
     expected_classes = Classes("class 1", "class2")
@@ -86,14 +168,14 @@ def test_html_builder_init() -> None:
     assert builder.attributes == expected_attributes
     assert builder.attributes.classes == expected_classes
     assert builder.classes == expected_classes
-    assert builder.elements == Elements()
+    assert builder.elements == EMPTY_ELEMENTS
 
     # Pass classes via classes argument (not overriding attributes)
     builder = HTMLBuilder(classes=expected_classes)
     assert builder.attributes == expected_attributes
     assert builder.attributes.classes == expected_classes
     assert builder.classes == expected_classes
-    assert builder.elements == Elements()
+    assert builder.elements == EMPTY_ELEMENTS
 
     # Pass classes via classes argument (overriding attributes)
     passed_attributes = Attributes({"id": "test", "class": "class3 Class-4"})
@@ -104,142 +186,107 @@ def test_html_builder_init() -> None:
     assert builder.attributes == expected_attributes
     assert builder.attributes.classes == expected_classes
     assert builder.classes == expected_classes
-    assert builder.elements == Elements()
+    assert builder.elements == EMPTY_ELEMENTS
 
     # Pass elements as an Elements object
     expected_elements = Elements(Div(), LineBreak())
     builder = HTMLBuilder(elements=expected_elements)
-    assert builder.attributes == Attributes()
-    assert builder.classes == Classes()
+    assert builder.attributes == EMPTY_ATTRIBUTES
+    assert builder.classes == EMPTY_CLASSES
     assert builder.elements == expected_elements
 
     # Pass elements as single string
     passed_elements = "Test string"
     expected_elements = Elements(passed_elements)
     builder = HTMLBuilder(elements=passed_elements)
-    assert builder.attributes == Attributes()
-    assert builder.classes == Classes()
+    assert builder.attributes == EMPTY_ATTRIBUTES
+    assert builder.classes == EMPTY_CLASSES
     assert builder.elements == expected_elements
 
     # Pass elements as single element
     passed_elements = Div()
     expected_elements = Elements(passed_elements)
     builder = HTMLBuilder(elements=passed_elements)
-    assert builder.attributes == Attributes()
-    assert builder.classes == Classes()
+    assert builder.attributes == EMPTY_ATTRIBUTES
+    assert builder.classes == EMPTY_CLASSES
     assert builder.elements == expected_elements
 
     # Pass elements as a list of elements
     passed_elements = [Div(), LineBreak()]
     expected_elements = Elements(*passed_elements)
     builder = HTMLBuilder(elements=passed_elements)
-    assert builder.attributes == Attributes()
-    assert builder.classes == Classes()
+    assert builder.attributes == EMPTY_ATTRIBUTES
+    assert builder.classes == EMPTY_CLASSES
     assert builder.elements == expected_elements
 
-    # Pass invalid values for elements
-    invalid_values = [
+
+@pytest.mark.parametrize(
+    "invalid_value, invalid_type",
+    [
         (1, "int"),
         (2.0, "float"),
         (True, "bool"),
         ({}, "dict"),
         ((), "tuple"),
-    ]
-    for invalid_value, invalid_type in invalid_values:
-        message = f"Invalid type {invalid_type} for Elements"
-        with pytest.raises(TypeError, match=message):
-            HTMLBuilder(elements=invalid_value)
-
-
-def test_html_builder_prettify() -> None:
+    ],
+)
+@pytest.mark.usefixtures("concrete_html_builder")
+def test_html_builder_init_invalid_elements(
+    invalid_value: Any, invalid_type: str
+) -> None:
+    """Tests initializing the HTMLBuilder class with invalid elements."""
+    message = f"Invalid type {invalid_type} for Elements"
+    with pytest.raises(TypeError, match=message):
+        HTMLBuilder(elements=invalid_value)
+
+
+@pytest.mark.parametrize(
+    "kwargs, indent",
+    [({}, 2), ({"indent": 4}, 4)],
+    ids=["default", "indent-4"],
+)
+def test_html_builder_prettify(
+    prettify_page: Page,
+    prettify_expected: dict[int, str],
+    kwargs: dict[str, Any],
+    indent: int,
+) -> None:
     """Tests the prettify method of the HTMLBuilder class."""
+    pytest.importorskip("bs4")
+    assert prettify_page.prettify(**kwargs) == prettify_expected[indent]
 
-    # Create a test page
-    page = Page(
-        elements=Elements(
-            Heading1("Test heading"),
-            HorizontalRule(),
-            Div(
-                elements=Elements(
-                    Paragraph("Test paragraph 1"),
-                    LineBreak(),
-                    Paragraph("Test paragraph 2"),
-                )
-            ),
-        ),
-        title="Test title",
-    )
-
-    # Determine the current directory
-    current_directory = pathlib.Path(__file__).parent.resolve()
-
-    # Test with default arguments
-    if BS4_INSTALLED:
-        filepath = os.path.join(
-            current_directory, r"_data/prettify_indent_2.html"
-        )
-        with open(filepath, "r", encoding="utf-8") as f:
-            expected = f.read()
-        assert page.prettify() == expected
 
-        # Test with a different indent
-        filepath = os.path.join(
-            current_directory, r"_data/prettify_indent_4.html"
-        )
-        with open(filepath, "r", encoding="utf-8") as f:
-            expected = f.read()
-        assert page.prettify(indent=4) == expected
-
-    else:
-        filepath = os.path.join(
-            current_directory, r"_data/prettify_indent_0.html"
-        )
-        with open(filepath, "r", encoding="utf-8") as f:
-            expected = f.read()
-        assert page.construct() == expected
+@pytest.mark.skipif(BS4_INSTALLED, reason="beautifulsoup4 is installed")
+def test_html_builder_prettify_fallback(
+    prettify_page: Page, prettify_expected: dict[int, str]
+) -> None:
+    """Tests the unprettified output used when bs4 is not installed."""
+    assert prettify_page.construct() == prettify_expected[0]
 
 
-def test_html_builder_save() -> None:
+def test_html_builder_save(
+    saving_builder: HTMLBuilder, tmp_path: pathlib.Path
+) -> None:
     """Tests the save method of the HTMLBuilder class."""
+    filepath = tmp_path / "test.html"
+    saving_builder.save(str(filepath))
+    assert filepath.read_text(encoding="utf-8") == saving_builder.construct()
 
-    # Override the abstract construct method
-    old_method = HTMLBuilder.construct
-    HTMLBuilder.construct = lambda _: (
-        "<!DOCTYPE html><html><body><p>Test paragraph</p></body></html>"
-    )
-    builder = HTMLBuilder()
 
-    # Determine the filepath to save to and create any necessary directories
-    current_directory = pathlib.Path(__file__).parent.resolve()
-    filepath = os.path.join(current_directory, r"_temp/test.html")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-    builder.save(filepath)
-    assert os.path.exists(filepath)
-    with open(filepath, "r", encoding="utf-8") as f:
-        expected = f.read()
-    assert expected == builder.construct()
-    os.remove(filepath)
-
-    # Test with prettify
-    filepath = os.path.join(current_directory, r"_temp/prettify_save.html")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-    builder.save(filepath, prettify=True)
-    assert os.path.exists(filepath)
-    with open(filepath, "r", encoding="utf-8") as f:
-        expected = f.read()
+def test_html_builder_save_prettify(
+    saving_builder: HTMLBuilder, tmp_path: pathlib.Path
+) -> None:
+    """Tests the save method of the HTMLBuilder class with prettify."""
+    filepath = tmp_path / "prettify_save.html"
+    saving_builder.save(str(filepath), prettify=True)
     if BS4_INSTALLED:
-        assert expected == builder.prettify()
+        expected = saving_builder.prettify()
     else:
-        assert expected == builder.construct()
-
-    os.remove(filepath)
-
-    # Reset the method
-    HTMLBuilder.construct = old_method
+        expected = saving_builder.construct()
+    assert filepath.read_text(encoding="utf-8") == expected
 
 
+@pytest.mark.usefixtures("concrete_html_builder")
 def test_html_builder_eq(builder: HTMLBuilder) -> None:
     """Tests the __eq__ method of the HTMLBuilder class."""
 
@@ -256,7 +303,7 @@ def test_html_builder_eq(builder: HTMLBuilder) -> None:
     assert builder == expected_builder
 
     # Compare to itself with attributes changed
-    expected_builder = deepcopy(builder)
+    expected_builder = _clone(builder)
     expected_builder.attributes.add({"required": False})
     assert builder != expected_builder
 
@@ -269,7 +316,7 @@ def test_html_builder_eq(builder: HTMLBuilder) -> None:
     assert builder != expected_builder
 
     # Compare to itself with elements changed
-    expected_builder = deepcopy(builder)
+    expected_builder = _clone(builder)
     expected_builder.elements.add(LineBreak())
     assert builder != expected_builder
 
@@ -290,28 +337,24 @@ def test_html_builder_eq(builder: HTMLBuilder) -> None:
     )
     assert builder != expected_builder
 
-    # Compare to other data types
-    assert builder != 1
-    assert builder != 2.0
-    assert builder is not True
-    assert builder is not False
-    assert builder != tuple()
-    assert builder != list()
-    assert builder != dict()
-    assert builder is not None
+
+def test_html_builder_ne_other_types(
+    builder: HTMLBuilder, non_equal_value: Any
+) -> None:
+    """Tests the __eq__ method of the HTMLBuilder class with other types."""
+    assert builder != non_equal_value
 
 
-def test_html_builder_str() -> None:
+@pytest.mark.usefixtures("concrete_html_builder")
+def test_html_builder_str(monkeypatch: pytest.MonkeyPatch) -> None:
     """Tests the __str__ method of the HTMLBuilder class."""
-    old_method = HTMLBuilder.construct
     expected = "<This is a mock HTMLBuilder object>"
-    HTMLBuilder.construct = lambda _: expected
+    monkeypatch.setattr(HTMLBuilder, "construct", lambda _: expected)
     builder = HTMLBuilder()
     assert str(builder) == expected
-    # Reset the method
-    HTMLBuilder.construct = old_method
 
 
+@pytest.mark.usefixtures("concrete_html_builder")
 def test_html_builder_repr(builder: HTMLBuilder) -> None:
     """Tests the __repr__ method of the HTMLBuilder class."""
 
@@ -325,6 +368,7 @@ def test_html_builder_repr(builder: HTMLBuilder) -> None:
     assert repr(builder) == expected
 
     # Try with no attributes
+    builder = _clone(builder)
     builder.attributes.clear()
     assert repr(builder) == "HTMLBuilder()"
 
@@ -479,14 +523,7 @@ def test_generic_element_clear(generic_element: GenericElement) -> None:
 
 def test_generic_element_construct(generic_element: GenericElement) -> None:
     """Tests the construct method of the GenericElement class."""
-    expected = (
-        "<div id='test' disabled class='class-1 class2'>"
-        "<img src='image1.png'>"
-        "<br>"
-        "<img src='image2.png' alt='Image 2'>"
-        "</div>"
-    )
-    assert generic_element.construct() == expected
+    assert generic_element.construct() == _EXPECTED_GENERIC_ELEMENT_HTML
     assert GenericElement("div").construct() == "<div></div>"
 
 
@@ -494,14 +531,8 @@ def test_generic_element_ladd(generic_element: GenericElement) -> None:
     """Tests the __add__ method of the GenericElement class."""
 
     # Try adding a string to the fixture
-    assert (generic_element + "Added text") == (
-        "<div id='test' disabled class='class-1 class2'>"
-        "<img src='image1.png'>"
-        "<br>"
-        "<img src='image2.png' alt='Image 2'>"
-        "</div>"
-        "Added text"
-    )
+    expected = _EXPECTED_GENERIC_ELEMENT_HTML + "Added text"
+    assert (generic_element + "Added text") == expected
 
     # Try adding a string to a fresh instance
     assert (GenericElement("div") + "Added text") == "<div></div>Added text"
@@ -521,14 +552,8 @@ def test_generic_element_radd(generic_element: GenericElement) -> None:
     """Tests the __radd__ method of the GenericElement class."""
 
     # Try adding a string to the fixture
-    assert ("Added text" + generic_element) == (
-        "Added text"
-        "<div id='test' disabled class='class-1 class2'>"
-        "<img src='image1.png'>"
-        "<br>"
-        "<img src='image2.png' alt='Image 2'>"
-        "</div>"
-    )
+    expected = "Added text" + _EXPECTED_GENERIC_ELEMENT_HTML
+    assert ("Added text" + generic_element) == expected
 
     # Try adding a string to a fresh instance
     assert ("Added text" + GenericElement("div")) == "Added text<div></div>"
@@ -2,6 +2,8 @@
 Contains tests for the elements.basic module.
 """
 
+from typing import Any
+
 import pytest
 
 from balisage.attributes import Attributes, Classes, Elements
@@ -10,8 +12,64 @@ from balisage.elements.format import HorizontalRule, LineBreak
 from balisage.elements.styles import Div
 from balisage.elements.text import Heading1, Paragraph
 
+_PAGE_BOILERPLATE = (
+    "<!DOCTYPE html>"
+    "<html{language}>"
+    "<head>"
+    "{charset}"
+    "<title>{title}</title>"
+    "{stylesheets}"
+    "</head>"
+    "<body>"
+    "{body}"
+    "</body>"
+    "</html>"
+)
+_EXPECTED_FULL_PAGE_HTML = _PAGE_BOILERPLATE.format(
+    language=" lang='fr'",
+    charset="<meta charset='UTF-16'>",
+    title="Test page",
+    stylesheets=(
+        "<link rel='stylesheet' href='style1.css'>"
+        "<link rel='stylesheet' href='style2.css'>"
+    ),
+    body=(
+        "<h1 id='title'>Title</h1>"
+        "<hr>"
+        "<div>"
+        "<p class='subtitle'>Test paragraph 1</p>"
+        "<br>"
+        "<p>Test paragraph 2</p>"
+        "</div>"
+    ),
+)
+_EXPECTED_MINIMAL_PAGE_HTML = _PAGE_BOILERPLATE.format(
+    language=" lang='en'",
+    charset="<meta charset='UTF-8'>",
+    title="Test page",
+    stylesheets="",
+    body="",
+)
+_EXPECTED_NO_CHARSET_PAGE_HTML = _PAGE_BOILERPLATE.format(
+    language=" lang='en'",
+    charset="",
+    title="Test page",
+    stylesheets="",
+    body="",
+)
+_EXPECTED_NO_LANG_PAGE_HTML = _PAGE_BOILERPLATE.format(
+    language="",
+    charset="<meta charset='UTF-8'>",
+    title="Test page",
+    stylesheets="",
+    body="",
+)
+
 # MARK: Fixtures
 
+# These fixtures stay function-scoped because the Page method tests mutate
+# both the page and the elements it wraps.
+
 
 @pytest.fixture
 def sample_elements() -> Elements:
@@ -199,65 +257,20 @@ def test_page_clear(page: Page) -> None:
 
 def test_page_construct(page: Page) -> None:
     """Tests the construct method of the Page class."""
-
-    # Define expected HTML
-    boilerplate = (
-        "<!DOCTYPE html>"
-        "<html{language}>"
-        "<head>"
-        "{charset}"
-        "<title>{title}</title>"
-        "{stylesheets}"
-        "</head>"
-        "<body>"
-        "{body}"
-        "</body>"
-        "</html>"
-    )
-
-    # Test with arguments from fixture
-    assert page.construct() == boilerplate.format(
-        language=" lang='fr'",
-        charset="<meta charset='UTF-16'>",
-        title="Test page",
-        stylesheets=(
-            "<link rel='stylesheet' href='style1.css'>"
-            "<link rel='stylesheet' href='style2.css'>"
-        ),
-        body=(
-            "<h1 id='title'>Title</h1>"
-            "<hr>"
-            "<div>"
-            "<p class='subtitle'>Test paragraph 1</p>"
-            "<br>"
-            "<p>Test paragraph 2</p>"
-            "</div>"
-        ),
-    )
-
-    # Test with an instance made with minimal arguments
-    assert Page("Test page").construct() == boilerplate.format(
-        language=" lang='en'",
-        charset="<meta charset='UTF-8'>",
-        title="Test page",
-        stylesheets="",
-        body="",
-    )
-
-    # Test with charset passed as None
-    assert Page("Test page", charset=None).construct() == boilerplate.format(
-        language=" lang='en'",
-        charset="",
-        title="Test page",
-        stylesheets="",
-        body="",
-    )
-
-    # Test with lang passed as None
-    assert Page("Test page", lang=None).construct() == boilerplate.format(
-        language="",
-        charset="<meta charset='UTF-8'>",
-        title="Test page",
-        stylesheets="",
-        body="",
-    )
+    assert page.construct() == _EXPECTED_FULL_PAGE_HTML
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, _EXPECTED_MINIMAL_PAGE_HTML),
+        ({"charset": None}, _EXPECTED_NO_CHARSET_PAGE_HTML),
+        ({"lang": None}, _EXPECTED_NO_LANG_PAGE_HTML),
+    ],
+    ids=["minimal", "no-charset", "no-lang"],
+)
+def test_page_construct_arguments(
+    kwargs: dict[str, Any], expected: str
+) -> None:
+    """Tests the construct method of the Page class with various arguments."""
+    assert Page("Test page", **kwargs).construct() == expected
@@ -6,35 +6,32 @@ import re
 
 import pytest
 
-from balisage.attributes import Attributes, Classes, Elements
+from balisage.attributes import Attributes, Classes
 from balisage.elements.format import HorizontalRule, LineBreak
-from balisage.elements.image import Image
 
 # MARK: Fixtures
 
 
-@pytest.fixture
-def sample_elements() -> Elements:
-    """Creates a sample list of data."""
-    return Elements(
-        Image(attributes=Attributes({"src": "image1.png"})),
-        LineBreak(),
-        Image(attributes=Attributes({"src": "image2.png", "alt": "Image 2"})),
-    )
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def line_break() -> LineBreak:
-    """Creates a sample LineBreak object that has classes and attributes."""
+    """Creates a sample LineBreak object that has classes and attributes.
+
+    The object is shared by the tests in this module, so it must not be
+    modified.
+    """
     return LineBreak(
         attributes=Attributes({"id": "test", "disabled": True}),
         classes=Classes("class 1", "class2"),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def horizontal_rule() -> HorizontalRule:
-    """Creates a sample HorizontalRule object that has classes and attributes."""
+    """Creates a sample HorizontalRule object that has classes and attributes.
+
+    The object is shared by the tests in this module, so it must not be
+    modified.
+    """
     return HorizontalRule(
         attributes=Attributes({"id": "test", "disabled": True}),
         classes=Classes("class 1", "class2"),
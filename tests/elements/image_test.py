@@ -10,9 +10,13 @@ from balisage.elements.image import Image
 # MARK: Fixtures
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def image() -> Image:
-    """Creates a sample Image object that has classes and attributes."""
+    """Creates a sample Image object that has classes and attributes.
+
+    The object is shared by the tests in this module, so it must not be
+    modified.
+    """
     return Image(
         attributes=Attributes({"id": "test", "disabled": True}),
         classes=Classes("class 1", "class2"),
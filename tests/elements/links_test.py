@@ -10,15 +10,23 @@ from balisage.elements.links import Link
 # MARK: Fixtures
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_elements() -> Elements:
-    """Creates a sample list of data."""
+    """Creates a sample list of data.
+
+    The object is shared by the tests in this module, so it must not be
+    modified.
+    """
     return Elements("Test hyperlink")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def link(sample_elements: Elements) -> Link:
-    """Creates a sample link object that has classes and attributes."""
+    """Creates a sample link object that has classes and attributes.
+
+    The object is shared by the tests in this module, so it must not be
+    modified.
+    """
     return Link(
         elements=sample_elements,
         attributes=Attributes({"href": "#", "alt": "Hyperlink"}),
@@ -14,18 +14,20 @@ from balisage.utilities.validate import (
     is_element,
     is_valid_class_name,
     is_valid_type,
+    parse_attribute_string,
     raise_for_type,
     sanitize_class_name,
+    sanitize_class_names,
     split_preserving_quotes,
     types_to_tuple,
 )
 
 
-def test_is_builder() -> None:
+def test_is_builder(monkeypatch: pytest.MonkeyPatch) -> None:
     """Tests the is_builder function."""
 
     # Override the abstract methods
-    HTMLBuilder.__abstractmethods__ = set()
+    monkeypatch.setattr(HTMLBuilder, "__abstractmethods__", frozenset())
 
     # Test with with an HTMLBuilder object
     assert is_builder(HTMLBuilder()) is False
@@ -39,11 +41,11 @@ def test_is_builder() -> None:
         assert is_builder(invalid_value) is False
 
 
-def test_is_element() -> None:
+def test_is_element(monkeypatch: pytest.MonkeyPatch) -> None:
     """Tests the is_element function."""
 
     # Override the abstract methods
-    HTMLBuilder.__abstractmethods__ = set()
+    monkeypatch.setattr(HTMLBuilder, "__abstractmethods__", frozenset())
 
     # Test with with an HTMLBuilder object
     assert is_element(HTMLBuilder()) is False
@@ -180,6 +182,62 @@ def test_split_preserving_quotes() -> None:
     assert split_preserving_quotes(string) == expected
 
 
+def test_sanitize_class_names() -> None:
+    """Tests the sanitize_class_names function."""
+    names = ["class 1", "clAss2", "Class 3", "  Class   4   "]
+    expected = ["class-1", "class2", "class-3", "class---4"]
+    assert sanitize_class_names(names) == expected
+    assert sanitize_class_names(names) == [
+        sanitize_class_name(name) for name in names
+    ]
+    # Test strip and lower options
+    names = [" ClASs 4  ", "Class 5 "]
+    assert sanitize_class_names(names, lower=False) == ["ClASs-4", "Class-5"]
+    assert sanitize_class_names(names, strip=False) == [
+        "-class-4--",
+        "class-5-",
+    ]
+    # Test with a name that contains a control character
+    message = "Class name 'a\x1fb' (sanitized to 'a\x1fb') is invalid"
+    with pytest.raises(ValueError, match=re.escape(message)):
+        sanitize_class_names(["a\x1fb", "c"])
+    # Test with zero and one names
+    assert sanitize_class_names([]) == []
+    assert sanitize_class_names(["Class 1"]) == ["class-1"]
+    # Test that the invalid name is reported
+    message = r"Class name '123' (sanitized to '123') is invalid"
+    with pytest.raises(ValueError, match=re.escape(message)):
+        sanitize_class_names(["class1", "123", "class2"])
+
+
+def test_parse_attribute_string() -> None:
+    """Tests the parse_attribute_string function."""
+
+    # Test with only boolean attributes
+    string = "required disabled itemscope"
+    expected = {"required": True, "disabled": True, "itemscope": True}
+    assert parse_attribute_string(string) == expected
+
+    # Test with differently quoted values
+    string = "id='test' class=\"class1 class2\" width=50"
+    expected = {"id": "test", "class": "class1 class2", "width": "50"}
+    assert parse_attribute_string(string) == expected
+
+    # Test with boolean and non-boolean attributes
+    string = "id='test' required class='class1 class2' alt='' itemscope"
+    expected = {
+        "id": "test",
+        "required": True,
+        "class": "class1 class2",
+        "alt": True,
+        "itemscope": True,
+    }
+    assert parse_attribute_string(string) == expected
+
+    # Test with an empty string
+    assert parse_attribute_string("") == {}
+
+
 def test_is_valid_class_name() -> None:
     """Tests the is_valid_class_name function."""
 
@@ -227,6 +285,23 @@ def test_classes_sanitize_class_name() -> None:
         )
         == "-ClASs-4--"
     )
+    # Test that replacements are applied in order
+    replacements = {" ": "_", "_": "x"}
+    assert sanitize_class_name("a b_c", replacements=replacements) == "axbxc"
+    replacements = {" ": "-", "--": "-"}
+    assert sanitize_class_name("my  class", replacements=replacements) == (
+        "my-class"
+    )
+    replacements = {"a": "b", "aa": "c"}
+    assert sanitize_class_name("aaa", replacements=replacements) == "bbb"
+    # Test single-character targets with longer replacements
+    replacements = {" ": "--", "_": ""}
+    assert sanitize_class_name("a b_c", replacements=replacements) == "a--bc"
+    # Test with no replacements
+    assert sanitize_class_name("class", replacements={}) == "class"
+    # Test that already canonical names still have replacements applied
+    assert sanitize_class_name("abc", replacements={"a": "z"}) == "zbc"
+    assert sanitize_class_name("class-1", replacements={"-": "_"}) == "class_1"
     # Test invalid class names
     message = r"Class name '123' (sanitized to '123') is invalid"
     with pytest.raises(ValueError, match=re.escape(message)):